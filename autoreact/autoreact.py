@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import re
+import random
 import time
-from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple, Union
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 import discord
 from redbot.core import Config, commands
@@ -13,7 +13,14 @@ from redbot.core.bot import Red
 
 log = logging.getLogger("red.autoreact")
 
-CUSTOM_EMOJI_RE = re.compile(r"^<?a?:[A-Za-z0-9_]{2,32}:\d{2,}>?$")
+RuntimeEmoji = Union[str, discord.PartialEmoji, discord.Emoji]
+EmojiKey = Tuple[Any, ...]
+QueuedMessage = Tuple[discord.Message, Dict[str, Any]]
+
+_TRUTHY = frozenset({"on", "true", "yes", "y", "1"})
+_FALSY = frozenset({"off", "false", "no", "n", "0"})
+
+_CHANNEL_CONVERTER = commands.TextChannelConverter()
 
 
 class AutoReact(commands.Cog):
@@ -23,6 +30,8 @@ class AutoReact(commands.Cog):
     __version__ = "1.0.0"
 
     DEFAULT_QUEUE_MAXSIZE = 1000
+    GUILD_CONCURRENCY = 4
+    FORBIDDEN_WARN_CACHE_SIZE = 1024
     RATELIMIT_TUNING_ENABLED = False
 
     def __init__(self, bot: Red) -> None:
@@ -42,17 +51,49 @@ class AutoReact(commands.Cog):
             log_channel_id=None,
         )
 
-        self._queues: Dict[int, asyncio.Queue[discord.Message]] = {}
-        self._workers: Dict[int, asyncio.Task] = {}
-        self._dropped_count: defaultdict[int, int] = defaultdict(int)
-        self._failure_count: defaultdict[int, int] = defaultdict(int)
-        self._forbidden_warned_at: Dict[Tuple[int, int], float] = {}
+        self._pending: Dict[int, Deque[QueuedMessage]] = {}
+        self._ready: Deque[int] = deque()
+        self._in_flight: Dict[int, int] = {}
+        self._next_allowed: Dict[int, float] = {}
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self._item_tasks: set[asyncio.Task] = set()
+        self._dropped_count: Dict[int, int] = {}
+        self._failure_count: Dict[int, int] = {}
+        self._forbidden_warned_at: OrderedDict[Tuple[int, int], float] = OrderedDict()
+        self._queue_full_warned_at: Dict[int, float] = {}
+        self._dropped_at_last_warn: Dict[int, int] = {}
+        self._settings_cache: Dict[int, Dict[str, Any]] = {}
+        self._settings_lock = asyncio.Lock()
+        self._settings_generation: Dict[int, int] = {}
+        self._enabled_guilds: set[int] = set()
+        self._active_channel: Dict[int, int] = {}
+        self._emoji_cache: Dict[int, Tuple[str, RuntimeEmoji, EmojiKey]] = {}
+
+    async def cog_load(self) -> None:
+        all_guilds = await self.config.all_guilds()
+        for guild_id, data in all_guilds.items():
+            self._track_guild(guild_id, enabled=data["enabled"], channel_id=data["channel_id"])
 
     async def cog_unload(self) -> None:
-        for task in self._workers.values():
+        tasks = list(self._item_tasks)
+        if self._worker is not None:
+            tasks.append(self._worker)
+        for task in tasks:
             task.cancel()
-        self._workers.clear()
-        self._queues.clear()
+        # Wait for in-flight add_reaction calls to unwind before the cog is torn down.
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+        self._item_tasks.clear()
+
+        self._pending.clear()
+        self._ready.clear()
+        self._in_flight.clear()
+        self._next_allowed.clear()
+        self._settings_cache.clear()
+        self._emoji_cache.clear()
+        self._enabled_guilds.clear()
+        self._active_channel.clear()
 
     async def red_delete_data_for_user(self, **kwargs: Any) -> None:
         return
@@ -63,7 +104,13 @@ class AutoReact(commands.Cog):
         if guild is None:
             return
 
-        settings = await self.config.guild(guild).all()
+        if guild.id not in self._enabled_guilds:
+            return
+
+        if message.channel.id != self._active_channel.get(guild.id):
+            return
+
+        settings = await self._get_settings(guild)
         if not settings["enabled"]:
             return
 
@@ -81,70 +128,154 @@ class AutoReact(commands.Cog):
         if settings["ignore_webhooks"] and message.webhook_id is not None:
             return
 
-        queue = self._queues.get(guild.id)
-        if queue is None:
-            queue = asyncio.Queue(maxsize=self.DEFAULT_QUEUE_MAXSIZE)
-            self._queues[guild.id] = queue
+        self._ensure_worker()
 
-        self._ensure_worker(guild.id)
+        if not self._enqueue(guild.id, message, settings):
+            dropped_total = self._dropped_count.get(guild.id, 0) + 1
+            self._dropped_count[guild.id] = dropped_total
+            now = time.monotonic()
+            if now - self._queue_full_warned_at.get(guild.id, 0.0) < 60.0:
+                return
 
-        try:
-            queue.put_nowait(message)
-        except asyncio.QueueFull:
-            self._dropped_count[guild.id] += 1
+            self._queue_full_warned_at[guild.id] = now
+            dropped = dropped_total - self._dropped_at_last_warn.get(guild.id, 0)
+            self._dropped_at_last_warn[guild.id] = dropped_total
             if settings["logging_enabled"]:
                 await self._maybe_log(
                     guild,
-                    f"AutoReact queue is full ({self.DEFAULT_QUEUE_MAXSIZE}); new messages are being dropped.",
+                    f"AutoReact queue is full ({self.DEFAULT_QUEUE_MAXSIZE}); {dropped} message(s) dropped since the last warning.",
+                    settings,
                 )
 
-    def _ensure_worker(self, guild_id: int) -> None:
-        task = self._workers.get(guild_id)
+    async def _get_settings(self, guild: discord.Guild) -> Dict[str, Any]:
+        settings = self._settings_cache.get(guild.id)
+        if settings is not None:
+            return settings
+
+        async with self._settings_lock:
+            settings = self._settings_cache.get(guild.id)
+            if settings is None:
+                generation = self._settings_generation.get(guild.id, 0)
+                settings = await self.config.guild(guild).all()
+                # A setter may have invalidated the entry while Config was being read.
+                if self._settings_generation.get(guild.id, 0) == generation:
+                    self._settings_cache[guild.id] = settings
+        return settings
+
+    def _invalidate_settings(self, guild_id: int) -> None:
+        self._settings_generation[guild_id] = self._settings_generation.get(guild_id, 0) + 1
+        self._settings_cache.pop(guild_id, None)
+
+    def _track_guild(self, guild_id: int, *, enabled: bool, channel_id: Optional[int]) -> None:
+        if channel_id is None:
+            self._active_channel.pop(guild_id, None)
+        else:
+            self._active_channel[guild_id] = channel_id
+
+        if enabled and channel_id is not None:
+            self._enabled_guilds.add(guild_id)
+        else:
+            self._enabled_guilds.discard(guild_id)
+            pending = self._pending.get(guild_id)
+            if pending:
+                pending.clear()
+
+    def _enqueue(self, guild_id: int, message: discord.Message, settings: Dict[str, Any]) -> bool:
+        if self._queue_length(guild_id) >= self.DEFAULT_QUEUE_MAXSIZE:
+            return False
+
+        pending = self._pending.get(guild_id)
+        if pending is None:
+            pending = self._pending[guild_id] = deque()
+            self._ready.append(guild_id)
+        pending.append((message, settings))
+        self._wakeup.set()
+        return True
+
+    def _queue_length(self, guild_id: int) -> int:
+        return len(self._pending.get(guild_id, ())) + self._in_flight.get(guild_id, 0)
+
+    def _next_ready(self) -> Tuple[Optional[Tuple[int, discord.Message, Dict[str, Any]]], Optional[float]]:
+        # Round-robin over guilds with pending messages, skipping guilds still inside their delay.
+        now = time.monotonic()
+        wait: Optional[float] = None
+        for _ in range(len(self._ready)):
+            guild_id = self._ready.popleft()
+            pending = self._pending[guild_id]
+            if guild_id not in self._enabled_guilds:
+                # Queued messages of a disabled guild would be no-ops; drop them without charging the delay.
+                pending.clear()
+            while pending and self._is_already_reacted(guild_id, *pending[0]):
+                pending.popleft()
+            if not pending:
+                del self._pending[guild_id]
+                continue
+
+            self._ready.append(guild_id)
+            if self._in_flight.get(guild_id, 0) >= self.GUILD_CONCURRENCY:
+                # A finishing item sets the wakeup event, so no timeout is needed here.
+                continue
+
+            allowed = self._next_allowed.get(guild_id, 0.0)
+            if allowed > now:
+                wait = allowed - now if wait is None else min(wait, allowed - now)
+                continue
+
+            message, settings = pending.popleft()
+            return (guild_id, message, settings), None
+        return None, wait
+
+    def _ensure_worker(self) -> None:
+        task = self._worker
         if task and not task.done():
             return
 
-        queue = self._queues[guild_id]
-        self._workers[guild_id] = asyncio.create_task(self._worker_loop(guild_id, queue))
+        self._worker = asyncio.create_task(self._worker_loop())
 
-    async def _worker_loop(self, guild_id: int, queue: asyncio.Queue[discord.Message]) -> None:
+    async def _worker_loop(self) -> None:
         while True:
-            try:
-                message = await queue.get()
+            self._wakeup.clear()
+            item, wait = self._next_ready()
+            if item is None:
                 try:
-                    await self._process_message(message)
-                finally:
-                    queue.task_done()
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                log.exception("AutoReact worker crashed unexpectedly in guild %s", guild_id)
-                await asyncio.sleep(1.0)
-
-    async def _process_message(self, message: discord.Message) -> None:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            guild_id, message, settings = item
+            self._in_flight[guild_id] = self._in_flight.get(guild_id, 0) + 1
+            self._next_allowed[guild_id] = time.monotonic() + self._delay_seconds(settings)
+            task = asyncio.create_task(self._run_item(guild_id, message, settings))
+            self._item_tasks.add(task)
+            task.add_done_callback(self._item_tasks.discard)
+
+    async def _run_item(self, guild_id: int, message: discord.Message, settings: Dict[str, Any]) -> None:
+        try:
+            await self._process_message(message, settings)
+        except Exception:
+            log.exception("AutoReact worker crashed unexpectedly in guild %s", guild_id)
+            self._next_allowed[guild_id] = max(self._next_allowed.get(guild_id, 0.0), time.monotonic() + 1.0)
+        finally:
+            self._in_flight[guild_id] -= 1
+            if not self._in_flight[guild_id]:
+                del self._in_flight[guild_id]
+            self._wakeup.set()
+
+    async def _process_message(self, message: discord.Message, settings: Dict[str, Any]) -> None:
         guild = message.guild
         if guild is None:
             return
 
-        settings = await self.config.guild(guild).all()
-        if not settings["enabled"]:
-            return
-
-        channel_id = settings["channel_id"]
-        emoji_raw = settings["emoji_raw"]
-        if channel_id is None or emoji_raw is None:
-            return
-
-        if message.channel.id != channel_id:
-            return
-
-        emoji = self._to_runtime_emoji(emoji_raw)
-        if emoji is None:
-            self._failure_count[guild.id] += 1
+        # on_message already validated these settings; only a disable since enqueue matters here.
+        if guild.id not in self._enabled_guilds:
             return
 
-        if self._has_same_reaction(message, emoji):
-            await self._sleep_delay(settings)
+        resolved = self._get_runtime_emoji(guild.id, settings["emoji_raw"])
+        if resolved is None:
+            self._count_failure(guild.id)
             return
+        emoji = resolved[0]
 
         max_retry = max(0, int(settings["max_retry"]))
         attempt = 0
@@ -153,20 +284,21 @@ class AutoReact(commands.Cog):
                 await message.add_reaction(emoji)
                 break
             except discord.Forbidden:
-                self._failure_count[guild.id] += 1
+                self._count_failure(guild.id)
                 await self._handle_forbidden(message, settings)
                 break
             except discord.NotFound:
                 break
             except discord.HTTPException as exc:
-                self._failure_count[guild.id] += 1
+                self._count_failure(guild.id)
                 if attempt < max_retry and (exc.status == 429 or 500 <= exc.status < 600):
                     attempt += 1
-                    await asyncio.sleep(1.0 + (attempt * 2.0))
+                    await asyncio.sleep(self._retry_delay(exc, attempt))
                     continue
                 break
 
-        await self._sleep_delay(settings)
+    def _count_failure(self, guild_id: int) -> None:
+        self._failure_count[guild_id] = self._failure_count.get(guild_id, 0) + 1
 
     async def _handle_forbidden(self, message: discord.Message, settings: Dict[str, Any]) -> None:
         guild = message.guild
@@ -180,26 +312,62 @@ class AutoReact(commands.Cog):
 
         if now - last_warn >= 60.0:
             self._forbidden_warned_at[warn_key] = now
+            self._forbidden_warned_at.move_to_end(warn_key)
+            if len(self._forbidden_warned_at) > self.FORBIDDEN_WARN_CACHE_SIZE:
+                self._forbidden_warned_at.popitem(last=False)
             if settings["logging_enabled"]:
                 await self._maybe_log(
                     guild,
                     f"AutoReact missing permissions in <#{channel_id}> (need View Channel / Read Message History / Add Reactions).",
+                    settings,
                 )
 
         if settings["auto_disable_on_forbidden"]:
+            # Other in-flight reactions may hit Forbidden too; only the first one disables and logs.
+            if guild.id not in self._enabled_guilds:
+                return
+            self._track_guild(guild.id, enabled=False, channel_id=settings["channel_id"])
             await self.config.guild(guild).enabled.set(False)
+            self._invalidate_settings(guild.id)
             if settings["logging_enabled"]:
                 await self._maybe_log(
                     guild,
                     "AutoReact has been automatically disabled due to Forbidden errors.",
+                    settings,
                 )
 
-    async def _sleep_delay(self, settings: Dict[str, Any]) -> None:
+    def _retry_delay(self, exc: discord.HTTPException, attempt: int) -> float:
+        response = getattr(exc, "response", None)
+        headers = getattr(response, "headers", None)
+        retry_after = headers.get("Retry-After") if headers else None
+        if retry_after is not None:
+            try:
+                return min(30.0, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        return min(30.0, 1.0 * (2**attempt)) * (0.5 + random.random())
+
+    def _delay_seconds(self, settings: Dict[str, Any]) -> float:
         delay_ms = int(settings["per_item_delay_ms"])
-        delay_ms = min(2000, max(100, delay_ms))
-        await asyncio.sleep(delay_ms / 1000)
+        return min(2000, max(0, delay_ms)) / 1000
+
+    def _is_already_reacted(self, guild_id: int, message: discord.Message, settings: Dict[str, Any]) -> bool:
+        resolved = self._get_runtime_emoji(guild_id, settings["emoji_raw"])
+        return resolved is not None and self._has_same_reaction(message, resolved[1])
 
-    def _to_runtime_emoji(self, emoji_raw: str) -> Optional[Union[str, discord.PartialEmoji, discord.Emoji]]:
+    def _get_runtime_emoji(self, guild_id: int, emoji_raw: str) -> Optional[Tuple[RuntimeEmoji, EmojiKey]]:
+        cached = self._emoji_cache.get(guild_id)
+        if cached is not None and cached[0] == emoji_raw:
+            return cached[1], cached[2]
+
+        emoji = self._to_runtime_emoji(emoji_raw)
+        if emoji is None:
+            return None
+        emoji_key = self._emoji_key(emoji)
+        self._emoji_cache[guild_id] = (emoji_raw, emoji, emoji_key)
+        return emoji, emoji_key
+
+    def _to_runtime_emoji(self, emoji_raw: str) -> Optional[RuntimeEmoji]:
         parsed = discord.PartialEmoji.from_str(emoji_raw)
         if parsed.id is not None:
             real_emoji = self.bot.get_emoji(parsed.id)
@@ -208,26 +376,24 @@ class AutoReact(commands.Cog):
             return parsed.name
         return None
 
-    def _has_same_reaction(self, message: discord.Message, emoji: Union[str, discord.PartialEmoji, discord.Emoji]) -> bool:
-        target = self._emoji_key(emoji)
-        for reaction in message.reactions:
-            if self._emoji_key(reaction.emoji) == target:
-                return True
-        return False
+    def _has_same_reaction(self, message: discord.Message, target: EmojiKey) -> bool:
+        return any(reaction.me and self._emoji_key(reaction.emoji) == target for reaction in message.reactions)
 
-    def _emoji_key(self, emoji: Union[str, discord.PartialEmoji, discord.Emoji]) -> str:
+    def _emoji_key(self, emoji: RuntimeEmoji) -> EmojiKey:
         if isinstance(emoji, str):
-            return f"u:{emoji}"
-        if isinstance(emoji, discord.Emoji):
-            prefix = "a" if emoji.animated else "s"
-            return f"c:{prefix}:{emoji.id}"
-        prefix = "a" if emoji.animated else "s"
+            return ("u", emoji)
         if emoji.id is not None:
-            return f"c:{prefix}:{emoji.id}"
-        return f"u:{emoji.name or ''}"
+            return ("c", emoji.animated, emoji.id)
+        return ("u", emoji.name or "")
 
-    async def _maybe_log(self, guild: discord.Guild, text: str) -> None:
-        settings = await self.config.guild(guild).all()
+    async def _maybe_log(
+        self,
+        guild: discord.Guild,
+        text: str,
+        settings: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if settings is None:
+            settings = await self._get_settings(guild)
         if not settings["logging_enabled"]:
             return
 
@@ -244,43 +410,38 @@ class AutoReact(commands.Cog):
         except discord.HTTPException:
             pass
 
-    async def _send_component(
+    async def _send_reply(
         self,
         ctx: commands.Context,
         title: str,
         lines: Optional[List[str]] = None,
     ) -> None:
-        body_lines = lines or []
-        view = discord.ui.LayoutView(timeout=60)
-        view.add_item(discord.ui.TextDisplay(f"## {title}"))
-        if body_lines:
-            view.add_item(discord.ui.Separator(visible=True))
-            view.add_item(discord.ui.TextDisplay("\n".join(body_lines)))
-        await ctx.send(view=view)
+        # Sends the title as a markdown heading followed by the body lines as plain message content.
+        content = f"## {title}"
+        if lines:
+            content += "\n" + "\n".join(lines)
+        await ctx.send(content)
 
     def _validate_emoji_input(self, emoji_raw: str) -> Tuple[bool, Optional[str]]:
         value = emoji_raw.strip()
         if not value:
             return False, None
 
-        if CUSTOM_EMOJI_RE.match(value):
+        parsed = discord.PartialEmoji.from_str(value)
+        if parsed.id is not None and parsed.name:
             return True, value
 
         # Treat non-ASCII single-token input as unicode emoji candidate.
-        if any(ord(ch) > 127 for ch in value) and all(not ch.isspace() for ch in value):
-            return True, value
-
-        parsed = discord.PartialEmoji.from_str(value)
-        if parsed.id is not None and parsed.name:
+        if not value.isascii() and len(value.split()) == 1:
             return True, value
 
         return False, None
 
     def _parse_on_off(self, value: str) -> Optional[bool]:
         lowered = value.strip().lower()
-        if lowered in {"on", "true", "yes", "y", "1"}:
+        if lowered in _TRUTHY:
             return True
-        if lowered in {"off", "false", "no", "n", "0"}:
+        if lowered in _FALSY:
             return False
         return None
 
@@ -289,7 +450,7 @@ class AutoReact(commands.Cog):
     @commands.admin_or_permissions(manage_guild=True)
     async def autoreact_group(self, ctx: commands.Context) -> None:
         """자동 반응 설정을 관리합니다."""
-        await self._send_component(
+        await self._send_reply(
             ctx,
             "AutoReact 명령 안내",
             [
@@ -314,7 +475,7 @@ class AutoReact(commands.Cog):
             missing.append("emoji")
 
         if missing:
-            await self._send_component(
+            await self._send_reply(
                 ctx,
                 "활성화 실패",
                 [f"누락된 설정: {', '.join(missing)}"],
@@ -322,7 +483,9 @@ class AutoReact(commands.Cog):
             return
 
         await self.config.guild(ctx.guild).enabled.set(True)
-        await self._send_component(ctx, "AutoReact를 활성화했습니다.")
+        self._invalidate_settings(ctx.guild.id)
+        self._track_guild(ctx.guild.id, enabled=True, channel_id=settings["channel_id"])
+        await self._send_reply(ctx, "AutoReact를 활성화했습니다.")
         await self._maybe_log(ctx.guild, f"{ctx.author.mention} 님이 AutoReact를 활성화했습니다.")
 
     @autoreact_group.command(name="disable")
@@ -330,7 +493,9 @@ class AutoReact(commands.Cog):
     async def autoreact_disable(self, ctx: commands.Context) -> None:
         """자동 반응을 비활성화합니다."""
         await self.config.guild(ctx.guild).enabled.set(False)
-        await self._send_component(ctx, "AutoReact를 비활성화했습니다.")
+        self._invalidate_settings(ctx.guild.id)
+        self._track_guild(ctx.guild.id, enabled=False, channel_id=self._active_channel.get(ctx.guild.id))
+        await self._send_reply(ctx, "AutoReact를 비활성화했습니다.")
         await self._maybe_log(ctx.guild, f"{ctx.author.mention} 님이 AutoReact를 비활성화했습니다.")
 
     @autoreact_group.command(name="setchannel")
@@ -338,9 +503,12 @@ class AutoReact(commands.Cog):
     async def autoreact_setchannel(self, ctx: commands.Context, *, channel: Optional[str] = None) -> None:
         """대상 채널을 설정합니다. 채널 멘션 또는 `none`을 사용하세요."""
         if channel is None or channel.strip().lower() == "none":
-            await self.config.guild(ctx.guild).channel_id.set(None)
-            await self.config.guild(ctx.guild).enabled.set(False)
-            await self._send_component(
+            async with self.config.guild(ctx.guild).all() as guild_settings:
+                guild_settings["channel_id"] = None
+                guild_settings["enabled"] = False
+            self._invalidate_settings(ctx.guild.id)
+            self._track_guild(ctx.guild.id, enabled=False, channel_id=None)
+            await self._send_reply(
                 ctx,
                 "대상 채널 설정 해제",
                 ["오동작 방지를 위해 AutoReact도 함께 비활성화했습니다."],
@@ -352,9 +520,9 @@ class AutoReact(commands.Cog):
             return
 
         try:
-            converted = await commands.TextChannelConverter().convert(ctx, channel)
+            converted = await _CHANNEL_CONVERTER.convert(ctx, channel)
         except commands.BadArgument:
-            await self._send_component(
+            await self._send_reply(
                 ctx,
                 "채널 입력 오류",
                 ["`#일반` 같은 채널 멘션 또는 `none`을 사용하세요."],
@@ -362,7 +530,9 @@ class AutoReact(commands.Cog):
             return
 
         await self.config.guild(ctx.guild).channel_id.set(converted.id)
-        await self._send_component(
+        self._invalidate_settings(ctx.guild.id)
+        self._track_guild(ctx.guild.id, enabled=ctx.guild.id in self._enabled_guilds, channel_id=converted.id)
+        await self._send_reply(
             ctx,
             "대상 채널 설정 완료",
             [f"{converted.mention}"],
@@ -378,7 +548,7 @@ class AutoReact(commands.Cog):
         """자동 반응에 사용할 이모지를 설정합니다."""
         valid, normalized = self._validate_emoji_input(emoji)
         if not valid or normalized is None:
-            await self._send_component(
+            await self._send_reply(
                 ctx,
                 "이모지 입력 오류",
                 ["예시: `✅`, `<:name:id>`, `<a:name:id>`, `name:id`"],
@@ -386,7 +556,9 @@ class AutoReact(commands.Cog):
             return
 
         await self.config.guild(ctx.guild).emoji_raw.set(normalized)
-        await self._send_component(
+        self._invalidate_settings(ctx.guild.id)
+        self._emoji_cache.pop(ctx.guild.id, None)
+        await self._send_reply(
             ctx,
             "반응 이모지 설정 완료",
             [f"`{normalized}`"],
@@ -406,9 +578,9 @@ class AutoReact(commands.Cog):
             channel = ctx.guild.get_channel(settings["channel_id"])
             channel_mention = channel.mention if channel else f"삭제된 채널 ({settings['channel_id']})"
 
-        queue_size = self._queues.get(ctx.guild.id).qsize() if ctx.guild.id in self._queues else 0
-        dropped = self._dropped_count[ctx.guild.id]
-        failed = self._failure_count[ctx.guild.id]
+        queue_size = self._queue_length(ctx.guild.id)
+        dropped = self._dropped_count.get(ctx.guild.id, 0)
+        failed = self._failure_count.get(ctx.guild.id, 0)
 
         lines = [
             f"enabled: {settings['enabled']}",
@@ -425,13 +597,13 @@ class AutoReact(commands.Cog):
             f"dropped_count: {dropped}",
             f"failure_count: {failed}",
         ]
-        await self._send_component(ctx, "AutoReact 상태", lines)
+        await self._send_reply(ctx, "AutoReact 상태", lines)
 
     @autoreact_group.group(name="set", invoke_without_command=True)
     @commands.admin_or_permissions(manage_guild=True)
     async def autoreact_set_group(self, ctx: commands.Context) -> None:
         """AutoReact 고급 옵션을 설정합니다."""
-        await self._send_component(
+        await self._send_reply(
             ctx,
             "AutoReact 고급 설정 명령",
             [
@@ -450,11 +622,12 @@ class AutoReact(commands.Cog):
         """봇 메시지를 무시할지 설정합니다."""
         parsed = self._parse_on_off(value)
         if parsed is None:
-            await self._send_component(ctx, "입력 오류", ["`on` 또는 `off`를 입력하세요."])
+            await self._send_reply(ctx, "입력 오류", ["`on` 또는 `off`를 입력하세요."])
             return
 
         await self.config.guild(ctx.guild).ignore_bots.set(parsed)
-        await self._send_component(ctx, "설정 변경 완료", [f"`ignore_bots` = `{parsed}`"])
+        self._invalidate_settings(ctx.guild.id)
+        await self._send_reply(ctx, "설정 변경 완료", [f"`ignore_bots` = `{parsed}`"])
 
     @autoreact_set_group.command(name="ignorewebhooks")
     @commands.admin_or_permissions(manage_guild=True)
@@ -462,30 +635,32 @@ class AutoReact(commands.Cog):
         """웹훅 메시지를 무시할지 설정합니다."""
         parsed = self._parse_on_off(value)
         if parsed is None:
-            await self._send_component(ctx, "입력 오류", ["`on` 또는 `off`를 입력하세요."])
+            await self._send_reply(ctx, "입력 오류", ["`on` 또는 `off`를 입력하세요."])
             return
 
         await self.config.guild(ctx.guild).ignore_webhooks.set(parsed)
-        await self._send_component(ctx, "설정 변경 완료", [f"`ignore_webhooks` = `{parsed}`"])
+        self._invalidate_settings(ctx.guild.id)
+        await self._send_reply(ctx, "설정 변경 완료", [f"`ignore_webhooks` = `{parsed}`"])
 
     @autoreact_set_group.command(name="ratelimit")
     @commands.admin_or_permissions(manage_guild=True)
     async def autoreact_set_ratelimit(self, ctx: commands.Context, ms: int) -> None:
         """메시지당 처리 지연(ms)을 설정합니다."""
         if not self.RATELIMIT_TUNING_ENABLED:
-            await self._send_component(
+            await self._send_reply(
                 ctx,
                 "변경 불가",
                 ["레이트리밋 튜닝은 기본적으로 잠겨 있습니다(OFF)."],
             )
             return
 
-        if ms < 100 or ms > 2000:
-            await self._send_component(ctx, "입력 오류", ["레이트리밋 값은 100~2000ms 사이여야 합니다."])
+        if ms < 0 or ms > 2000:
+            await self._send_reply(ctx, "입력 오류", ["레이트리밋 값은 0~2000ms 사이여야 합니다."])
             return
 
         await self.config.guild(ctx.guild).per_item_delay_ms.set(ms)
-        await self._send_component(ctx, "설정 변경 완료", [f"`per_item_delay_ms` = `{ms}`"])
+        self._invalidate_settings(ctx.guild.id)
+        await self._send_reply(ctx, "설정 변경 완료", [f"`per_item_delay_ms` = `{ms}`"])
 
     @autoreact_set_group.command(name="autodisableforbidden")
     @commands.admin_or_permissions(manage_guild=True)
@@ -493,11 +668,12 @@ class AutoReact(commands.Cog):
         """권한 오류 시 자동 비활성화 여부를 설정합니다."""
         parsed = self._parse_on_off(value)
         if parsed is None:
-            await self._send_component(ctx, "입력 오류", ["`on` 또는 `off`를 입력하세요."])
+            await self._send_reply(ctx, "입력 오류", ["`on` 또는 `off`를 입력하세요."])
             return
 
         await self.config.guild(ctx.guild).auto_disable_on_forbidden.set(parsed)
-        await self._send_component(
+        self._invalidate_settings(ctx.guild.id)
+        await self._send_reply(
             ctx,
             "설정 변경 완료",
             [f"`auto_disable_on_forbidden` = `{parsed}`"],
@@ -509,11 +685,12 @@ class AutoReact(commands.Cog):
         """이 Cog의 로그 기능을 활성화/비활성화합니다."""
         parsed = self._parse_on_off(value)
         if parsed is None:
-            await self._send_component(ctx, "입력 오류", ["`on` 또는 `off`를 입력하세요."])
+            await self._send_reply(ctx, "입력 오류", ["`on` 또는 `off`를 입력하세요."])
             return
 
         await self.config.guild(ctx.guild).logging_enabled.set(parsed)
-        await self._send_component(ctx, "설정 변경 완료", [f"`logging_enabled` = `{parsed}`"])
+        self._invalidate_settings(ctx.guild.id)
+        await self._send_reply(ctx, "설정 변경 완료", [f"`logging_enabled` = `{parsed}`"])
 
     @autoreact_set_group.command(name="logchannel")
     @commands.admin_or_permissions(manage_guild=True)
@@ -521,13 +698,14 @@ class AutoReact(commands.Cog):
         """로그 채널을 설정합니다. 채널 멘션 또는 `none`을 사용하세요."""
         if channel is None or channel.strip().lower() == "none":
             await self.config.guild(ctx.guild).log_channel_id.set(None)
-            await self._send_component(ctx, "설정 변경 완료", ["`log_channel_id`를 해제했습니다."])
+            self._invalidate_settings(ctx.guild.id)
+            await self._send_reply(ctx, "설정 변경 완료", ["`log_channel_id`를 해제했습니다."])
             return
 
         try:
-            converted = await commands.TextChannelConverter().convert(ctx, channel)
+            converted = await _CHANNEL_CONVERTER.convert(ctx, channel)
         except commands.BadArgument:
-            await self._send_component(
+            await self._send_reply(
                 ctx,
                 "채널 입력 오류",
                 ["채널 멘션 또는 `none`을 사용하세요."],
@@ -535,7 +713,8 @@ class AutoReact(commands.Cog):
             return
 
         await self.config.guild(ctx.guild).log_channel_id.set(converted.id)
-        await self._send_component(
+        self._invalidate_settings(ctx.guild.id)
+        await self._send_reply(
             ctx,
             "설정 변경 완료",
             [f"`log_channel_id` = {converted.mention}"],